@@ -18,6 +18,8 @@ class Event(Generic[TSender, TEvent]):
     def __init__(self, name):
         self.name = name
         self._handler_lock = Lock()
+        # The handler list is never modified in-place, it is replaced on register/deregister.
+        # This allows the list to be read while notifying without locking or copying it
         self._handlers = []
 
     def register(self, handler: Callable[[TSender, TEvent], None]) -> EventSubscriptionContext[TSender, TEvent]:
@@ -39,7 +41,7 @@ class Event(Generic[TSender, TEvent]):
         """
         with self._handler_lock:
             if handler not in self._handlers:
-                self._handlers.append(handler)
+                self._handlers = self._handlers + [handler]
         return EventSubscriptionContext(self, handler)
 
     def deregister(self, handler: Callable[[TSender, TEvent], None]):
@@ -51,7 +53,7 @@ class Event(Generic[TSender, TEvent]):
         """
         with self._handler_lock:
             if handler in self._handlers:
-                self._handlers.remove(handler)
+                self._handlers = [h for h in self._handlers if h != handler]
 
 
 class EventSource(Event):
@@ -68,8 +70,7 @@ class EventSource(Event):
         """
         Gets if the event has any handlers subscribed to the event
         """
-        with self._handler_lock:
-            return bool(self._handlers)
+        return bool(self._handlers)
 
     def clear_handlers(self):
         """
@@ -82,10 +83,7 @@ class EventSource(Event):
         """
         Notifies all subscribers with the given sender and event arguments
         """
-        with self._handler_lock:
-            handlers = self._handlers[:]
-
-        for h in handlers:
+        for h in self._handlers:
             try:
                 h(sender, event_args)
             except Exception as e:
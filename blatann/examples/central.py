@@ -1,11 +1,13 @@
 """
 This example demonstrates implementing a central BLE connection in a procedural manner. Each bluetooth operation
-performed is done sequentially in a linear fashion, and the main context blocks until each operation completes
-before moving on to the rest of the program
+performed is done sequentially in a linear fashion, and the main context awaits each operation using asyncio
+before moving on to the rest of the program. Awaiting the operations does not block any threads,
+the BLE driver's event thread completes each operation's future once it finishes
 
 This is designed to work alongside the peripheral example running on a separate nordic chip
 """
-import struct
+import asyncio
+import threading
 from blatann import BleDevice
 from blatann.gap import smp
 from blatann.examples import example_utils, constants
@@ -26,20 +28,62 @@ def on_counting_char_notification(characteristic, event_args):
     :type event_args: blatann.event_args.NotificationReceivedEventArgs
     """
     # Unpack as a little-endian, 4-byte integer
-    current_count = struct.unpack("<I", event_args.value)[0]
-    logger.info("Counting char notification. Curent count: {}".format(current_count))
+    current_count = int.from_bytes(event_args.value, "little")
+    logger.info("Counting char notification. Current count: %d", current_count)
 
 
-def on_passkey_entry(peer, passkey_event_args):
+def log_future_exception(future):
     """
-    Callback for when the user is requested to enter a passkey to resume the pairing process.
+    Done-callback for futures whose result isn't otherwise checked. Logs the exception raised, if any
+
+    :param future: The future that completed
+    :type future: concurrent.futures.Future
+    """
+    if not future.cancelled() and future.exception():
+        logger.error("Error occurred in background task", exc_info=future.exception())
+
+
+def input_async(prompt):
+    """
+    Reads a line from the user without blocking the event loop. input() runs on a daemon thread rather than
+    the loop's default executor, so a pending prompt doesn't keep the program from exiting
+
+    :param prompt: The prompt to display
+    :return: Future which completes with the line entered
+    :rtype: asyncio.Future
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def set_result(setter, value):
+        if not future.done():
+            setter(value)
+
+    def read_input():
+        try:
+            setter, value = future.set_result, input(prompt)
+        except Exception as e:
+            setter, value = future.set_exception, e
+        try:
+            loop.call_soon_threadsafe(set_result, setter, value)
+        except RuntimeError:
+            # The event loop was closed while waiting on the user, nothing is waiting on the result anymore
+            pass
+
+    threading.Thread(target=read_input, name="PasskeyInput", daemon=True).start()
+    return future
+
+
+async def on_passkey_entry(peer, passkey_event_args):
+    """
+    Coroutine for when the user is requested to enter a passkey to resume the pairing process.
     Requests the user to enter the passkey and resolves the event with the passkey entered
 
     :param peer: the peer the passkey is for
     :param passkey_event_args:
     :type passkey_event_args: blatann.event_args.PasskeyEntryEventArgs
     """
-    passkey = input("Enter peripheral passkey: ")
+    passkey = await input_async("Enter peripheral passkey: ")
     passkey_event_args.resolve(passkey)
 
 
@@ -75,7 +119,9 @@ def on_peripheral_security_request(peer, event_args):
     #   event_args.force_repair()
 
 
-def main(serial_port):
+async def _main_async(serial_port):
+    loop = asyncio.get_running_loop()
+
     # Set the target to the peripheral's advertised name
     target_device_name = constants.PERIPHERAL_NAME
 
@@ -88,7 +134,7 @@ def main(serial_port):
     ble_device.scanner.set_default_scan_params(timeout_seconds=4)
 
     logger.info("Scanning for '{}'".format(target_device_name))
-    target_address = example_utils.find_target_device(ble_device, target_device_name)
+    target_address = await loop.run_in_executor(None, example_utils.find_target_device, ble_device, target_device_name)
 
     if not target_address:
         logger.info("Did not find target peripheral")
@@ -96,7 +142,7 @@ def main(serial_port):
 
     # Initiate the connection and wait for it to finish
     logger.info("Found match: connecting to address {}".format(target_address))
-    peer = ble_device.connect(target_address).wait()
+    peer = await ble_device.connect(target_address).wait_async()
     if not peer:
         logger.warning("Timed out connecting to device")
         return
@@ -106,61 +152,95 @@ def main(serial_port):
     # Should be done right after connection in case the peripheral initiates a security request
     peer.security.set_security_params(passcode_pairing=True, io_capabilities=smp.IoCapabilities.KEYBOARD_DISPLAY,
                                       bond=False, out_of_band=False)
-    # Register the callback for when a passkey needs to be entered by the user
-    peer.security.on_passkey_required.register(on_passkey_entry)
+    # Register the callback for when a passkey needs to be entered by the user.
+    # The event is emitted from a blatann thread, so hand it off to the event loop
+    def on_passkey_required(peer, passkey_event_args):
+        future = asyncio.run_coroutine_threadsafe(on_passkey_entry(peer, passkey_event_args), loop)
+        future.add_done_callback(log_future_exception)
+
+    peer.security.on_passkey_required.register(on_passkey_required)
     # Register the callback for if a peripheral requests security
     peer.security.on_peripheral_security_request.register(on_peripheral_security_request)
 
     # Wait up to 10 seconds for service discovery to complete
-    _, event_args = peer.discover_services().wait(10, exception_on_timeout=False)
+    _, event_args = await peer.discover_services().wait_async(10, exception_on_timeout=False)
     logger.info("Service discovery complete! status: {}".format(event_args.status))
 
     # Log each service found
     for service in peer.database.services:
         logger.info(service)
 
-    peer.set_connection_parameters(100, 120, 6000)  # Discovery complete, go to a longer connection interval
+    # Discovery complete, go to a longer connection interval. No need to wait for the update to finish,
+    # it's negotiated in the background while the rest of the program runs
+    peer.set_connection_parameters(100, 120, 6000)
 
-    # Wait up to 60 seconds for the pairing process, if the link is not secured yet
+    # Start the pairing process if the link is not secured yet. Pairing runs alongside the connection parameter update
+    pair_waitable = None
     if peer.security.security_level == smp.SecurityLevel.OPEN:
-        peer.security.pair().wait(60)
+        pair_waitable = peer.security.pair()
 
-    # Find the counting characteristic
+    # Find the characteristics in the discovered database while the procedures above are in progress.
+    # The hex conversion characteristic takes in a bytestream and converts it to its
+    # hex representation. e.g. '0123' -> '30313233'
     counting_char = peer.database.find_characteristic(constants.COUNTING_CHAR_UUID)
+    hex_convert_char = peer.database.find_characteristic(constants.HEX_CONVERT_CHAR_UUID)
+
+    # Wait up to 60 seconds for the pairing process to complete
+    if pair_waitable:
+        await pair_waitable.wait_async(60)
+
     if counting_char:
         logger.info("Subscribing to the counting characteristic")
-        counting_char.subscribe(on_counting_char_notification).wait(5)
+        await counting_char.subscribe(on_counting_char_notification).wait_async(5)
     else:
         logger.warning("Failed to find counting characteristic")
 
-    # Find the hex conversion characteristic. This characteristic takes in a bytestream and converts it to its
-    # hex representation. e.g. '0123' -> '30313233'
-    hex_convert_char = peer.database.find_characteristic(constants.HEX_CONVERT_CHAR_UUID)
     if hex_convert_char:
         # Generate some data ABCDEFG... Then, incrementally send increasing lengths of strings.
         # i.e. first send 'A', then 'AB', then 'ABC'...
         data_to_convert = bytes(ord('A') + i for i in range(12))
+
+        def queue_conversion(i):
+            # When we read the characteristic after the write the peripheral should have converted the string
+            data = data_to_convert[:i+1]
+            return data, hex_convert_char.write(data), hex_convert_char.read()
+
+        # Reads and writes are processed in the order they are issued. Keep the next write+read pair queued
+        # while waiting on the current one so it is sent as soon as the current one finishes,
+        # rather than waiting on this context to issue it
+        next_conversion = queue_conversion(0)
         for i in range(len(data_to_convert)):
-            data_to_send = data_to_convert[:i+1]
+            data_to_send, write_waitable, read_waitable = next_conversion
+            next_conversion = queue_conversion(i+1) if i+1 < len(data_to_convert) else None
             logger.info("Converting to hex data: '{}'".format(data_to_send))
 
-            # Write the data, waiting up to 5 seconds for the write to complete
-            if not hex_convert_char.write(data_to_send).wait(5, False):
+            # Wait up to 5 seconds for the write to complete
+            _, event_args = await write_waitable.wait_async(5, False)
+            if not event_args:
                 logger.error("Failed to write data, i={}".format(i))
+                # Operations already issued can't be taken back out of the GATT queue.
+                # They're still sent in order and will either run or fail during the disconnect below
+                pending = ["read of '{}'".format(data_to_send)]
+                if next_conversion:
+                    pending.append("write+read of '{}'".format(next_conversion[0]))
+                logger.warning("Still queued, will run or fail during disconnect: {}".format(", ".join(pending)))
                 break
 
-            # Write was successful, when we read the characteristic the peripheral should have converted the string
-            # Once again, initiate a read and wait up to 5 seconds for the read to complete
-            char, event_args = hex_convert_char.read().wait(5, False)
+            # Write was successful, wait up to 5 seconds for the read to complete
+            char, event_args = await read_waitable.wait_async(5, False)
             logger.info("Hex: '{}'".format(event_args.value.decode("ascii")))
     else:
         logger.warning("Failed to find hex convert char")
 
     # Clean up
     logger.info("Disconnecting from peripheral")
-    peer.disconnect().wait()
+    await peer.disconnect().wait_async()
     ble_device.close()
 
 
+def main(serial_port):
+    asyncio.run(_main_async(serial_port))
+
+
 if __name__ == '__main__':
     main("COM11")
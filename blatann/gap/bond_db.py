@@ -1,7 +1,24 @@
+from __future__ import annotations
 import typing
+from typing import Optional, Tuple
+
+from blatann.gap import smp_crypto
 
 if typing.TYPE_CHECKING:
     from blatann.gap.gap_types import PeerAddress
+    from blatann.nrf.nrf_types import BLEGapMasterId
+
+
+def master_id_key(master_id: BLEGapMasterId) -> Optional[Tuple[int, bytes]]:
+    """
+    Gets the hashable key used to look up an LTK by its master ID
+
+    :param master_id: The master ID to get the key for
+    :return: The (ediv, rand) key, or None if the master ID is not valid
+    """
+    if not master_id.is_valid:
+        return None
+    return master_id.ediv, bytes(master_id.rand)
 
 
 class BondingData(object):
@@ -13,6 +30,20 @@ class BondingData(object):
         self.peer_ltk = bonding_keyset.peer_keys.enc_key
         self.peer_id = bonding_keyset.peer_keys.id_key
         self.peer_sign = bonding_keyset.peer_keys.sign_key
+        self._init_lookup_keys()
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # Bonding data saved by previous versions does not have the lookup keys
+        self._init_lookup_keys()
+
+    def _init_lookup_keys(self):
+        keys = [master_id_key(self.own_ltk.master_id), master_id_key(self.peer_ltk.master_id)]
+        self.ltk_master_id_keys: Tuple[Tuple[int, bytes], ...] = tuple(k for k in keys if k)
+        # IRK is stored little-endian, keep a big-endian copy for resolving private addresses.
+        # Peers which did not distribute an IRK (all zeros) cannot be resolved
+        irk = bytes(self.peer_id.irk)
+        self.peer_irk_be: Optional[bytes] = irk[::-1] if any(irk) else None
 
 
 class BondDbEntry(object):
@@ -46,6 +77,55 @@ class BondDatabase(object):
         """
         raise NotImplementedError()
 
+    def find_entry_by_peer_address(self, peer_is_client: bool, peer_addr: PeerAddress) -> Optional[BondDbEntry]:
+        """
+        Finds the entry bonded with the given identity (public or random static) address.
+        The default implementation iterates through the database, subclasses can override to provide faster lookups
+
+        :param peer_is_client: The role of the peer to match against
+        :param peer_addr: The identity address of the peer
+        :return: The matching entry, or None if not found
+        """
+        for r in self:
+            if r.peer_is_client == peer_is_client and r.peer_addr == peer_addr:
+                return r
+        return None
+
+    def find_entry_by_master_id(self, peer_is_client: bool, master_id: BLEGapMasterId) -> Optional[BondDbEntry]:
+        """
+        Finds the entry which has either its own or the peer's LTK identified by the given master ID.
+        The default implementation iterates through the database, subclasses can override to provide faster lookups
+
+        :param peer_is_client: The role of the peer to match against
+        :param master_id: The master ID (EDIV and Rand) to find
+        :return: The matching entry, or None if not found
+        """
+        key = master_id_key(master_id)
+        if not key:
+            return None
+        for r in self:
+            if r.peer_is_client == peer_is_client and key in r.bonding_data.ltk_master_id_keys:
+                return r
+        return None
+
+    def find_entry_by_private_address(self, peer_is_client: bool, peer_addr: PeerAddress) -> Optional[BondDbEntry]:
+        """
+        Finds the entry whose IRK resolves the given resolvable private address.
+        The default implementation tries the IRK of every entry, subclasses can override to provide faster lookups
+
+        :param peer_is_client: The role of the peer to match against
+        :param peer_addr: The resolvable private address of the peer
+        :return: The matching entry, or None if not found
+        """
+        # Split the address into its prand and hash parts once rather than for every record checked
+        p_rand, addr_hash = smp_crypto.private_address_parts(peer_addr)
+        for r in self:
+            if r.peer_is_client != peer_is_client or not r.bonding_data.peer_irk_be:
+                continue
+            if smp_crypto.ble_ah(r.bonding_data.peer_irk_be, p_rand) == addr_hash:
+                return r
+        return None
+
 
 class BondDatabaseLoader(object):
     def load(self):
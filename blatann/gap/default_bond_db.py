@@ -1,10 +1,17 @@
 import os
 import logging
 import pickle
-from typing import List
+import threading
+import typing
+from collections import OrderedDict
+from typing import List, Dict, Tuple
 
 import blatann
-from blatann.gap.bond_db import BondDatabase, BondDbEntry, BondDatabaseLoader
+from blatann.gap import smp_crypto
+from blatann.gap.bond_db import BondDatabase, BondDbEntry, BondDatabaseLoader, master_id_key
+
+if typing.TYPE_CHECKING:
+    from blatann.gap.gap_types import PeerAddress
 
 
 logger = logging.getLogger(__name__)
@@ -43,14 +50,81 @@ class DefaultBondDatabaseLoader(BondDatabaseLoader):
 
 
 class DefaultBondDatabase(BondDatabase):
+    # Max number of resolvable private addresses to remember the resolved entry for
+    RESOLVED_ADDRESS_CACHE_SIZE = 32
+
     def __init__(self):
         self._records: List[BondDbEntry] = []
         self.current_id = 0
+        self._addr_index: Dict[Tuple[bool, PeerAddress], BondDbEntry] = {}
+        self._master_id_index: Dict[Tuple[bool, int, bytes], BondDbEntry] = {}
+        self._resolved_addr_cache: Dict[Tuple[bool, bytes], BondDbEntry] = OrderedDict()
+        self._resolved_addr_cache_lock = threading.Lock()
+        # Incremented whenever the indices are rebuilt, guarded by the resolved address cache lock
+        self._index_generation = 0
 
     def __iter__(self):
         for r in self._records:
             yield r
 
+    def __getstate__(self):
+        # Indices and caches are derived from the records, don't store them in the database file
+        state = self.__dict__.copy()
+        for key in ["_addr_index", "_master_id_index", "_resolved_addr_cache", "_resolved_addr_cache_lock",
+                    "_index_generation"]:
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._resolved_addr_cache = OrderedDict()
+        self._resolved_addr_cache_lock = threading.Lock()
+        self._index_generation = 0
+        self._rebuild_indices()
+
+    def _rebuild_indices(self):
+        self._addr_index = {}
+        self._master_id_index = {}
+        with self._resolved_addr_cache_lock:
+            self._index_generation += 1
+            self._resolved_addr_cache.clear()
+        # Use setdefault so that the first matching record wins, same as a linear search
+        for r in self._records:
+            self._addr_index.setdefault((r.peer_is_client, r.peer_addr), r)
+            if not r.bonding_data:
+                continue
+            for ediv, rand in r.bonding_data.ltk_master_id_keys:
+                self._master_id_index.setdefault((r.peer_is_client, ediv, rand), r)
+
+    def find_entry_by_peer_address(self, peer_is_client, peer_addr):
+        return self._addr_index.get((peer_is_client, peer_addr), None)
+
+    def find_entry_by_master_id(self, peer_is_client, master_id):
+        key = master_id_key(master_id)
+        if not key:
+            return None
+        return self._master_id_index.get((peer_is_client, *key), None)
+
+    def find_entry_by_private_address(self, peer_is_client, peer_addr):
+        # Peers keep the same private address until it's rotated (typically every 15 minutes),
+        # remember which entry it resolved to so reconnects don't need to try every IRK again
+        key = (peer_is_client, bytes(peer_addr.addr))
+        with self._resolved_addr_cache_lock:
+            entry = self._resolved_addr_cache.get(key, None)
+            generation = self._index_generation
+        if entry:
+            return entry
+
+        entry = super(DefaultBondDatabase, self).find_entry_by_private_address(peer_is_client, peer_addr)
+        if entry:
+            with self._resolved_addr_cache_lock:
+                # Only cache the result if the records didn't change during the scan, the entry may have been deleted
+                if generation == self._index_generation:
+                    self._resolved_addr_cache[key] = entry
+                    if len(self._resolved_addr_cache) > self.RESOLVED_ADDRESS_CACHE_SIZE:
+                        self._resolved_addr_cache.popitem(last=False)
+        return entry
+
     def create(self):
         db_entry = BondDbEntry(self.current_id)
         self.current_id += 1
@@ -64,11 +138,13 @@ class DefaultBondDatabase(BondDatabase):
             if r.id == db_entry.id:
                 raise ValueError("There already exists an entry with id {}".format(r.id))
         self._records.append(db_entry)
+        self._rebuild_indices()
 
     def update(self, db_entry):
         if not isinstance(db_entry, BondDbEntry):
             raise ValueError(db_entry)
-        # TODO
+        # Entries are stored by reference, only the lookup indices need to be refreshed
+        self._rebuild_indices()
 
     def delete(self, db_entry):
         if not isinstance(db_entry, BondDbEntry):
@@ -77,7 +153,12 @@ class DefaultBondDatabase(BondDatabase):
         for i, entry in enumerate(self._records):
             if entry.id == db_entry.id:
                 del self._records[i]
+                self._rebuild_indices()
+                # Don't keep the deleted bond's IRK around in the cipher cache
+                smp_crypto.clear_key_cache()
                 return
 
     def delete_all(self):
         self._records = []
+        self._rebuild_indices()
+        smp_crypto.clear_key_cache()
@@ -57,7 +57,7 @@ class Scanner(object):
         ble_device.ble_driver.event_subscribe(self._on_timeout_event, nrf_events.GapEvtTimeout)
         self.scan_report = ScanReportCollection()
         self._on_scan_received: EventSource[Scanner, ScanReport] = EventSource("On Scan Received", logger)
-        self._on_scan_timeout: EventSource[Scanner, ScanReportCollection] = EventSource("On Scan Timeout")
+        self._on_scan_timeout: EventSource[Scanner, ScanReportCollection] = EventSource("On Scan Timeout", logger)
 
     @property
     def on_scan_received(self) -> Event[Scanner, ScanReport]:
@@ -27,6 +27,13 @@ SecurityStatus = nrf_types.BLEGapSecStatus
 # Enum of the different Pairing passkeys to be entered by the user (passcode, out-of-band, etc.)
 AuthenticationKeyType = nrf_types.BLEGapAuthKeyType
 
+# Identity address types, which are compared directly against the bond database instead of being resolved with an IRK
+_IDENTITY_ADDR_TYPES = (nrf_types.BLEGapAddrTypes.random_static, nrf_types.BLEGapAddrTypes.public)
+
+# Keys distributed by each side during bonding (LTK and IRK). These are only read when converted to C structs
+_KEYSET_OWN = nrf_types.BLEGapSecKeyDist(True, True, False, False)
+_KEYSET_PEER = nrf_types.BLEGapSecKeyDist(True, True, False, False)
+
 
 class SecurityLevel(enum.Enum):
     """
@@ -112,6 +119,8 @@ class SecurityManager(object):
         self.ble_device = ble_device
         self.peer = peer
         self._security_params = security_parameters
+        self._cached_sec_params = None
+        self._cached_sec_params_key = None
         self._pairing_in_process = False
         self._initiated_encryption = False
         self._is_previously_bonded_device = False
@@ -353,70 +362,66 @@ class SecurityManager(object):
         self.keyset = nrf_types.BLEGapSecKeyset()
         self.keyset.own_keys.public_key.key = smp_crypto.lesc_pubkey_to_raw(self._public_key)
 
-        self.peer.driver_event_subscribe(self._on_security_params_request, nrf_events.GapEvtSecParamsRequest)
-        self.peer.driver_event_subscribe(self._on_authentication_status, nrf_events.GapEvtAuthStatus)
-        self.peer.driver_event_subscribe(self._on_conn_sec_status, nrf_events.GapEvtConnSecUpdate)
-        self.peer.driver_event_subscribe(self._on_auth_key_request, nrf_events.GapEvtAuthKeyRequest)
-        self.peer.driver_event_subscribe(self._on_passkey_display, nrf_events.GapEvtPasskeyDisplay)
-        self.peer.driver_event_subscribe(self._on_security_info_request, nrf_events.GapEvtSecInfoRequest)
-        self.peer.driver_event_subscribe(self._on_lesc_dhkey_request, nrf_events.GapEvtLescDhKeyRequest)
-        self.peer.driver_event_subscribe(self._on_security_request, nrf_events.GapEvtSecRequest)
+        subscribe = self.peer.driver_event_subscribe
+        subscribe(self._on_security_params_request, nrf_events.GapEvtSecParamsRequest)
+        subscribe(self._on_authentication_status, nrf_events.GapEvtAuthStatus)
+        subscribe(self._on_conn_sec_status, nrf_events.GapEvtConnSecUpdate)
+        subscribe(self._on_auth_key_request, nrf_events.GapEvtAuthKeyRequest)
+        subscribe(self._on_passkey_display, nrf_events.GapEvtPasskeyDisplay)
+        subscribe(self._on_security_info_request, nrf_events.GapEvtSecInfoRequest)
+        subscribe(self._on_lesc_dhkey_request, nrf_events.GapEvtLescDhKeyRequest)
+        subscribe(self._on_security_request, nrf_events.GapEvtSecRequest)
 
         # Search the bonding DB for this peer's info
         self.bond_db_entry = self._find_db_entry(self.peer.peer_address)
         if self.bond_db_entry:
-            logger.info("Connected to previously bonded device {}".format(self.bond_db_entry.peer_addr))
+            logger.info("Connected to previously bonded device %s", self.bond_db_entry.peer_addr)
             self._is_previously_bonded_device = True
         else:
             self._is_previously_bonded_device = False
 
     def _find_db_entry(self, peer_address, master_id=None):
-        for r in self.ble_device.bond_db:
-            # Check that roles match
-            if self.peer.is_client != r.peer_is_client:
-                continue
-            # Check if peer address matches
-            if self._peer_address_matches_or_resolves(peer_address, r):
-                # If the bonding data is LESC, always return it.
-                # Otherwise if a master ID is provided to match against, it should be used
-                if r.bonding_data.own_ltk.enc_info.lesc or not master_id:
-                    logger.debug("Matched database entry on peer address")
-                    return r
-
-            # Check for master IDs
-            if master_id:
-                own_mid = r.bonding_data.own_ltk.master_id
-                peer_mid = r.bonding_data.peer_ltk.master_id
-                if own_mid == master_id:
-                    logger.debug("Found matching record with own master ID")
-                    return r
-                if peer_mid == master_id:
-                    logger.debug("Found matching record with peer master ID")
-                    return r
+        # Check for master IDs
+        if master_id:
+            r = self.ble_device.bond_db.find_entry_by_master_id(self.peer.is_client, master_id)
+            if r:
+                logger.debug("Found matching record with master ID")
+                return r
+
+        # Check if peer address matches
+        r = self._find_db_entry_by_address(peer_address)
+        # If the bonding data is LESC, always return it.
+        # Otherwise if a master ID is provided to match against, it should be used
+        if r and (r.bonding_data.own_ltk.enc_info.lesc or not master_id):
+            logger.debug("Matched database entry on peer address")
+            return r
 
         return None
 
-    def _peer_address_matches_or_resolves(self, peer_address, bond_record):
+    def _find_db_entry_by_address(self, peer_address):
         if peer_address.addr_type == nrf_types.BLEGapAddrTypes.random_private_non_resolvable:
-            return False
+            return None
+
+        # If peer address is public or random static, look up directly (no IRK needed)
+        if peer_address.addr_type in _IDENTITY_ADDR_TYPES:
+            return self.ble_device.bond_db.find_entry_by_peer_address(self.peer.is_client, peer_address)
 
-        # If peer address is public or random static, check directly if they match (no IRK needed)
-        if peer_address.addr_type in [nrf_types.BLEGapAddrTypes.random_static, nrf_types.BLEGapAddrTypes.public]:
-            if bond_record.peer_addr == peer_address:
-                return True
-        elif smp_crypto.private_address_resolves(peer_address, bond_record.bonding_data.peer_id.irk):
-            logger.info("Resolved Peer address to {}".format(bond_record.peer_addr))
-            return True
-        return False
+        r = self.ble_device.bond_db.find_entry_by_private_address(self.peer.is_client, peer_address)
+        if r:
+            logger.info("Resolved Peer address to %s", r.peer_addr)
+        return r
 
     def _get_security_params(self):
-        keyset_own = nrf_types.BLEGapSecKeyDist(True, True, False, False)
-        keyset_peer = nrf_types.BLEGapSecKeyDist(True, True, False, False)
-        sec_params = nrf_types.BLEGapSecParams(self._security_params.bond, self._security_params.passcode_pairing,
-                                               self._security_params.lesc_pairing, False,
-                                               self._security_params.io_capabilities,
-                                               self._security_params.out_of_band, 7, 16, keyset_own, keyset_peer)
-        return sec_params
+        # The security parameters can be modified in-place by the user, so the cached params
+        # are keyed off of the current values rather than invalidated when set
+        params = self._security_params
+        key = (params.bond, params.passcode_pairing, params.lesc_pairing, params.io_capabilities, params.out_of_band)
+        if self._cached_sec_params is None or key != self._cached_sec_params_key:
+            self._cached_sec_params = nrf_types.BLEGapSecParams(params.bond, params.passcode_pairing,
+                                                                params.lesc_pairing, False, params.io_capabilities,
+                                                                params.out_of_band, 7, 16, _KEYSET_OWN, _KEYSET_PEER)
+            self._cached_sec_params_key = key
+        return self._cached_sec_params
 
     def _on_security_params_request(self, driver, event):
         """
@@ -497,14 +502,14 @@ class SecurityManager(object):
         if not self.bond_db_entry:
             self.bond_db_entry = self._find_db_entry(self.peer.peer_address, event.master_id)
 
+        ble_driver = self.ble_device.ble_driver
         if self.bond_db_entry:
             self._initiated_encryption = True
-            ltk = self.bond_db_entry.bonding_data.own_ltk
-            id_key = self.bond_db_entry.bonding_data.peer_id
-            self.ble_device.ble_driver.ble_gap_sec_info_reply(event.conn_handle, ltk.enc_info, id_key, None)
+            bonding_data = self.bond_db_entry.bonding_data
+            ble_driver.ble_gap_sec_info_reply(event.conn_handle, bonding_data.own_ltk.enc_info, bonding_data.peer_id, None)
         else:
-            logger.info("Unable to find Bonding record for peer master id {}".format(event.master_id))
-            self.ble_device.ble_driver.ble_gap_sec_info_reply(event.conn_handle)
+            logger.info("Unable to find Bonding record for peer master id %s", event.master_id)
+            ble_driver.ble_gap_sec_info_reply(event.conn_handle)
 
     def _on_lesc_dhkey_request(self, driver, event):
         """
@@ -562,6 +567,7 @@ class SecurityManager(object):
             else:  # update the bonding info
                 logger.info("Updating bond key for peer {}".format(self.keyset.peer_keys.id_key.peer_addr))
                 self.bond_db_entry.bonding_data = BondingData(self.keyset)
+                self.ble_device.bond_db.update(self.bond_db_entry)
 
             # TODO: This doesn't belong here..
             self.ble_device.bond_db_loader.save(self.ble_device.bond_db)
@@ -589,7 +595,6 @@ class SecurityManager(object):
                                                              target=self._on_passkey_display_event.notify,
                                                              args=(self.peer, event_args),
                                                              daemon=True)
-            self._auth_key_resolve_thread.daemon = True
             self._auth_key_resolve_thread.start()
         else:
             self._on_passkey_display_event.notify(self.peer, event_args)
@@ -599,17 +604,20 @@ class SecurityManager(object):
         :type event: nrf_events.GapEvtAuthKeyRequest
         """
         passkey_entered = threading.Event()
+        ble_driver = self.ble_device.ble_driver
 
         def resolve(passkey):
             if not self._pairing_in_process or passkey_entered.is_set():
                 return
             if isinstance(passkey, int):
-                passkey = "{:06d}".format(passkey).encode("ascii")
+                passkey = b"%06d" % passkey
             elif isinstance(passkey, str):
                 passkey = passkey.encode("ascii")
-            self.ble_device.ble_driver.ble_gap_auth_key_reply(self.peer.conn_handle, event.key_type, passkey)
+            ble_driver.ble_gap_auth_key_reply(self.peer.conn_handle, event.key_type, passkey)
             passkey_entered.set()
 
+        # Handlers are expected to block waiting on user input, use a dedicated daemon thread so pending
+        # requests do not stall other connections or prevent the process from exiting
         self._auth_key_resolve_thread = threading.Thread(name="{} Passkey Entry".format(self.peer.conn_handle),
                                                          target=self._on_passkey_entry_event.notify,
                                                          args=(self.peer, PasskeyEntryEventArgs(event.key_type, resolve)),
@@ -1,4 +1,6 @@
 import binascii
+import functools
+import threading
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import ec
@@ -9,6 +11,9 @@ from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 _lesc_curve = ec.SECP256R1
 _backend = default_backend()
 
+# Zero-padding prepended to the 3-byte prand to fill up a 16-byte AES block for ah()
+_AH_PADDING = bytes(13)
+
 
 def lesc_pubkey_to_raw(public_key, little_endian=True):
     """
@@ -95,6 +100,28 @@ def lesc_compute_dh_key(private_key, peer_public_key, little_endian=False):
     return dh_key
 
 
+@functools.lru_cache(maxsize=64)
+def _ecb_encryptor(key):
+    """
+    Gets an AES-128 ECB encryptor for the given key. ECB has no chaining between blocks, so a single
+    encryptor context can be reused indefinitely without re-running the key schedule.
+    The context is shared between threads, so it is returned along with a lock which guards its use
+
+    :param key: The key to use, in big endian format
+    :type key: bytes
+    :return: The (lock, encryptor) pair for the key
+    """
+    return threading.Lock(), Cipher(algorithms.AES(key), modes.ECB(), _backend).encryptor()
+
+
+def clear_key_cache():
+    """
+    Clears the cipher contexts cached for the keys used with ble_ah().
+    This should be called when keys are no longer in use (e.g. bonds are deleted) so they are not kept in memory
+    """
+    _ecb_encryptor.cache_clear()
+
+
 def ble_ah(key, p_rand):
     """
     Function for calculating the ah() hash function described in Bluetooth core specification 4.2 section 3.H.2.2.2.
@@ -107,20 +134,35 @@ def ble_ah(key, p_rand):
     :return:
     """
     if len(p_rand) != 3:
-        raise ValueError("Prand must be a str or bytes of length 3")
+        raise ValueError("Prand must be bytes of length 3")
 
     # prepend the prand with 0's to fill up a 16-byte block
-    p_rand = b"\x00" * 13 + p_rand
-
-    cipher = Cipher(algorithms.AES(key), modes.ECB(), _backend)
-    encryptor = cipher.encryptor()
+    block = _AH_PADDING + bytes(p_rand)
 
     # Encrypt and return the last 3 bytes
-    encrypted_hash = encryptor.update(p_rand) + encryptor.finalize()
+    lock, encryptor = _ecb_encryptor(bytes(key))
+    with lock:
+        encrypted_hash = encryptor.update(block)
     return encrypted_hash[-3:]
 
 
-def private_address_resolves(peer_addr, irk):
+def private_address_parts(peer_addr):
+    """
+    Splits a Private Resolvable Peer Address into the random number and hash portions used for resolving it
+
+    :param peer_addr: The peer address to split
+    :return: The (prand, hash) bytes of the address
+    """
+    # Address is stored MSB-first, either as bytes or a list of ints
+    addr = peer_addr.addr
+    # prand consists of the first 3 MSB bytes of the peer address
+    p_rand = bytes(addr[:3])
+    # the calculated hash is the last 3 LSB bytes of the peer address
+    addr_hash = bytes(addr[3:])
+    return p_rand, addr_hash
+
+
+def private_address_resolves(peer_addr, irk, little_endian=True):
     """
     Checks if the given peer address can be resolved with the IRK
 
@@ -130,16 +172,15 @@ def private_address_resolves(peer_addr, irk):
 
     :param peer_addr: The peer address to check
     :param irk: The identity resolve key to try
+    :param little_endian: Whether the IRK is little endian (as stored by the Nordic) and needs to be reversed.
+                          Pass False if the IRK is already big endian, e.g. BondingData.peer_irk_be
     :return: True if it resolves, False if not
     """
-    # prand consists of the first 3 MSB bytes of the peer address
-    p_rand = bytes(peer_addr.addr[:3])
-    # the calculated hash is the last 3 LSB bytes of the peer address
-    addr_hash = bytes(peer_addr.addr[3:])
-    # IRK is stored in little-endian bytearray, convert to string and reverse
-    irk = bytes(irk)[::-1]
-    local_hash = ble_ah(irk, p_rand)
-    return local_hash == addr_hash
+    p_rand, addr_hash = private_address_parts(peer_addr)
+    irk = bytes(irk)
+    if little_endian:
+        irk = irk[::-1]
+    return ble_ah(irk, p_rand) == addr_hash
 
 
 # BLE LESC Debug keys, defined in the Core Bluetooth Specification v4.2 Vol.3, Part H, Section 2.3.5.6.1
@@ -25,6 +25,12 @@ class EventWaitable(Waitable, Generic[TSender, TEvent]):
             return None, None
         return res
 
+    async def wait_async(self, timeout=None, exception_on_timeout=True) -> Tuple[TSender, TEvent]:
+        res = await super(EventWaitable, self).wait_async(timeout, exception_on_timeout)
+        if res is None:  # Timeout, send None, None for the sender and event_args
+            return None, None
+        return res
+
     def then(self, callback: Callable[[TSender, TEvent], None]):
         return super(EventWaitable, self).then(callback)
 
@@ -1,7 +1,6 @@
 from queue import Queue
 from typing import Iterable
 from blatann.waitables.waitable import Waitable
-from blatann.nrf.nrf_events import GapEvtTimeout, BLEGapTimeoutSrc, GapEvtAdvReport
 from blatann.gap.advertise_data import ScanReport, ScanReportCollection
 
 
@@ -13,10 +12,12 @@ class ScanFinishedWaitable(Waitable):
     def __init__(self, ble_device):
         super(ScanFinishedWaitable, self).__init__()
         self.scanner = ble_device.scanner
-        ble_device.ble_driver.event_subscribe(self._on_timeout_event, GapEvtTimeout)
-        self.scanner.on_scan_received.register(self._on_scan_report)
         self.ble_driver = ble_device.ble_driver
         self._scan_report_queue = Queue()
+        # The scanner is already subscribed to the driver's timeout event, use its event instead
+        # of subscribing to the driver for every scan started
+        self.scanner.on_scan_received.register(self._on_scan_report)
+        self.scanner.on_scan_timeout.register(self._on_scan_timeout)
 
     @property
     def scan_reports(self) -> Iterable[ScanReport]:
@@ -29,24 +30,22 @@ class ScanFinishedWaitable(Waitable):
             yield scan_report
             scan_report = self._scan_report_queue.get()
 
-    def _event_occurred(self, ble_driver):
-        ble_driver.event_unsubscribe(self._on_timeout_event, GapEvtTimeout)
+    def _deregister_handlers(self):
+        self.scanner.on_scan_timeout.deregister(self._on_scan_timeout)
         self.scanner.on_scan_received.deregister(self._on_scan_report)
-        self._notify(self.scanner.scan_report)
 
     def _on_timeout(self):
-        self.ble_driver.event_unsubscribe(self._on_timeout_event, GapEvtTimeout)
-        self.scanner.on_scan_received.deregister(self._on_scan_report)
+        self._deregister_handlers()
 
     def _on_scan_report(self, device, scan_report):
         self._scan_report_queue.put(scan_report)
 
-    def _on_timeout_event(self, ble_driver, event):
-        """
-        :type event: GapEvtTimeout
-        """
-        if event.src == BLEGapTimeoutSrc.scan:
-            self._event_occurred(ble_driver)
+    def _on_scan_timeout(self, device, scan_report_collection):
+        self._deregister_handlers()
+        try:
+            self._notify(scan_report_collection)
+        finally:
+            # Always terminate the scan_reports iterable, even if a callback failed
             self._scan_report_queue.put(None)
 
     def wait(self, timeout: float = None, exception_on_timeout: bool = True) -> ScanReportCollection:
@@ -59,3 +58,15 @@ class ScanFinishedWaitable(Waitable):
         :return: The scan report collection
         """
         return super(ScanFinishedWaitable, self).wait(timeout, exception_on_timeout)
+
+    async def wait_async(self, timeout: float = None, exception_on_timeout: bool = True) -> ScanReportCollection:
+        """
+        Waits for the scanning operation to complete without blocking the running asyncio event loop,
+        then returns the scan report collection
+
+        :param timeout: How long to wait for, in seconds
+        :param exception_on_timeout: Flag whether or not to throw an exception if the operation timed out.
+               If false and a timeout occurs, will return None
+        :return: The scan report collection
+        """
+        return await super(ScanFinishedWaitable, self).wait_async(timeout, exception_on_timeout)
@@ -1,5 +1,7 @@
 from typing import Callable
+import asyncio
 import queue
+import threading
 from blatann.exceptions import TimeoutError
 
 
@@ -13,6 +15,10 @@ class Waitable(object):
         self._queue = queue.Queue()
         self._callback = None
         self._n_args = n_args
+        self._future_lock = threading.Lock()
+        self._future = None
+        self._future_loop = None
+        self._results = None
         if n_args < 1:
             raise ValueError()
 
@@ -39,15 +45,80 @@ class Waitable(object):
             did_timeout = True
 
         if did_timeout:
-            self._on_timeout()
-            if exception_on_timeout:
-                raise TimeoutError("Timed out waiting for event to occur. "
-                                   "Waitable type: {}".format(self.__class__.__name__))
+            return self._timed_out(exception_on_timeout)
+
+    async def wait_async(self, timeout: float = None, exception_on_timeout=True):
+        """
+        Waits for the asynchronous operation to complete without blocking the running asyncio event loop.
+        This is the ``await``-able equivalent of :meth:`wait`
+
+        .. warning::
+           If this call times out, it cannot be (successfully) called again as it will clean up all event handlers for the waitable.
+           This is done to remove lingering references to the waitable object through event subscriptions
+
+        :param timeout: How long to wait, or ``None`` to wait indefinitely
+        :param exception_on_timeout: Flag to either throw an exception on timeout, or instead return ``None`` object(s)
+        :return: The result of the asynchronous operation
+        :raises: TimeoutError
+        """
+        try:
+            # Shield the future so it isn't cancelled on timeout, subsequent calls can still wait on it
+            return await asyncio.wait_for(asyncio.shield(self.as_future()), timeout)
+        except asyncio.TimeoutError:
+            return self._timed_out(exception_on_timeout)
+
+    def as_future(self, loop: asyncio.AbstractEventLoop = None) -> asyncio.Future:
+        """
+        Gets an :class:`python:asyncio.Future` which completes when the asynchronous operation completes.
+        The future's result is the same value returned by :meth:`wait`.
+
+        The future is completed from the BLE driver's event thread using ``call_soon_threadsafe``,
+        so no thread is blocked while waiting on the operation.
+
+        .. note:: Only a single future is created per waitable-- subsequent calls return the same future,
+           unless it was cancelled
+
+        :param loop: The event loop to create the future on. Defaults to the currently running event loop
+        :return: The future for the asynchronous operation
+        """
+        with self._future_lock:
+            if self._future is None or self._future.cancelled():
+                self._future_loop = loop or asyncio.get_running_loop()
+                self._future = self._future_loop.create_future()
+                # Operation may have already completed before the future was requested
+                if self._results is not None:
+                    self._schedule_future_result(self._results)
+            return self._future
+
+    def _timed_out(self, exception_on_timeout):
+        self._on_timeout()
+        if exception_on_timeout:
+            raise TimeoutError("Timed out waiting for event to occur. "
+                               "Waitable type: {}".format(self.__class__.__name__))
 
         if self._n_args == 1:
             return None
         return [None] * self._n_args
 
+    def _set_future_result(self, results):
+        # Future may have been cancelled by the user
+        if self._future.done():
+            return
+        if len(results) == 1:
+            self._future.set_result(results[0])
+        else:
+            self._future.set_result(results)
+
+    def _schedule_future_result(self, results):
+        future, loop = self._future, self._future_loop
+        if future is None or future.done():
+            return
+        try:
+            loop.call_soon_threadsafe(self._set_future_result, results)
+        except RuntimeError:
+            # The event loop which created the future was closed, nothing can be waiting on it anymore
+            pass
+
     def then(self, callback: Callable):
         """
         Registers a function callback that will be called when the asynchronous operation completes
@@ -67,6 +138,9 @@ class Waitable(object):
 
     def _notify(self, *results):
         self._queue.put(results)
+        with self._future_lock:
+            self._results = results
+            self._schedule_future_result(results)
         if self._callback:
             self._callback(*results)
 
@@ -92,6 +166,11 @@ class EmptyWaitable(Waitable):
     def wait(self, timeout=None, exception_on_timeout=True):
         return self._args
 
+    def as_future(self, loop=None):
+        future = (loop or asyncio.get_running_loop()).create_future()
+        future.set_result(self._args)
+        return future
+
     def then(self, callback):
         if callback and callable(callback):
             callback(*self._args)
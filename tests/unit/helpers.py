@@ -0,0 +1,36 @@
+import types
+
+from blatann.gap.bond_db import BondDbEntry, BondingData
+from blatann.gap.gap_types import PeerAddress
+from blatann.nrf.nrf_types import (BLEGapAddrTypes, BLEGapEncryptInfo, BLEGapEncryptKey, BLEGapIdKey, BLEGapMasterId,
+                                   BLEGapSecKeys)
+
+
+def peer_address(last_byte, addr_type=BLEGapAddrTypes.random_static):
+    return PeerAddress(addr_type, [0xC0, 0x11, 0x22, 0x33, 0x44, last_byte])
+
+
+def master_id(ediv=None):
+    """
+    Creates a master ID with the given EDIV, or an invalid (all zeros) master ID as LESC bonds have if ediv is None
+    """
+    if ediv is None:
+        return BLEGapMasterId(0, bytearray(BLEGapMasterId.RAND_LEN))
+    return BLEGapMasterId(ediv, bytearray(range(1, BLEGapMasterId.RAND_LEN + 1)))
+
+
+def keyset(own_ediv=None, peer_ediv=None, irk=b"\x01" * 16, lesc=False):
+    # The driver-backed BLEGapSecKeyset isn't needed, BondingData only reads the own/peer keys
+    own_keys = BLEGapSecKeys(enc_key=BLEGapEncryptKey(BLEGapEncryptInfo(lesc=lesc), master_id(own_ediv)))
+    peer_keys = BLEGapSecKeys(enc_key=BLEGapEncryptKey(BLEGapEncryptInfo(lesc=lesc), master_id(peer_ediv)),
+                              id_key=BLEGapIdKey(irk))
+    return types.SimpleNamespace(own_keys=own_keys, peer_keys=peer_keys)
+
+
+def add_entry(db, peer_addr, bonding_keyset, peer_is_client=False) -> BondDbEntry:
+    entry = db.create()
+    entry.peer_addr = peer_addr
+    entry.peer_is_client = peer_is_client
+    entry.bonding_data = BondingData(bonding_keyset)
+    db.add(entry)
+    return entry
@@ -0,0 +1,157 @@
+import binascii
+import pickle
+import unittest
+from unittest import mock
+
+from blatann.gap import smp_crypto
+from blatann.gap.bond_db import BondDatabase, BondingData
+from blatann.gap.default_bond_db import DefaultBondDatabase
+from blatann.gap.gap_types import PeerAddress
+from blatann.nrf.nrf_types import BLEGapAddrTypes, BLEGapSignKey
+
+from tests.unit.helpers import add_entry, keyset, master_id, peer_address
+
+
+# IRK and resolvable address from the Bluetooth Core Specification v4.2 Vol.3, Part H, Appendix D.7.
+# The IRK is stored little-endian, the same as it's received from the driver
+SPEC_IRK = binascii.unhexlify("ec0234a357c8ad05341010a60a397d9b")[::-1]
+SPEC_PRIVATE_ADDR = PeerAddress(BLEGapAddrTypes.random_private_resolvable, [0x70, 0x81, 0x94, 0x0d, 0xfb, 0xaa])
+
+
+def _keysets():
+    return [keyset(10, 11), keyset(20, 21, irk=b"\x02" * 16), keyset(30, 31, irk=SPEC_IRK)]
+
+
+def _old_format_bonding_data(bonding_keyset):
+    # Bonding data saved before the lookup keys were added only has the key objects
+    bonding_data = BondingData.__new__(BondingData)
+    bonding_data.own_ltk = bonding_keyset.own_keys.enc_key
+    bonding_data.peer_ltk = bonding_keyset.peer_keys.enc_key
+    bonding_data.peer_id = bonding_keyset.peer_keys.id_key
+    bonding_data.peer_sign = BLEGapSignKey()
+    return bonding_data
+
+
+class TestDefaultBondDatabase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = DefaultBondDatabase()
+        self.entries = [add_entry(self.db, peer_address(i), k) for i, k in enumerate(_keysets())]
+
+    def _assert_lookups(self, db):
+        entry_ids = [e.id for e in db]
+        self.assertEqual(entry_ids[1], db.find_entry_by_peer_address(False, peer_address(1)).id)
+        self.assertEqual(entry_ids[0], db.find_entry_by_master_id(False, master_id(10)).id)
+        self.assertEqual(entry_ids[2], db.find_entry_by_master_id(False, master_id(31)).id)
+        self.assertEqual(entry_ids[2], db.find_entry_by_private_address(False, SPEC_PRIVATE_ADDR).id)
+        # Wrong role
+        self.assertIsNone(db.find_entry_by_peer_address(True, peer_address(1)))
+        self.assertIsNone(db.find_entry_by_master_id(True, master_id(10)))
+        self.assertIsNone(db.find_entry_by_private_address(True, SPEC_PRIVATE_ADDR))
+
+    def test_lookups(self):
+        self._assert_lookups(self.db)
+        self.assertIsNone(self.db.find_entry_by_peer_address(False, peer_address(5)))
+        self.assertIsNone(self.db.find_entry_by_master_id(False, master_id(50)))
+        self.assertIsNone(self.db.find_entry_by_master_id(False, master_id()))
+
+    def test_update(self):
+        entry = self.entries[1]
+        entry.bonding_data = BondingData(keyset(40, 41))
+        self.db.update(entry)
+        self.assertIs(entry, self.db.find_entry_by_master_id(False, master_id(41)))
+        self.assertIsNone(self.db.find_entry_by_master_id(False, master_id(21)))
+
+    def test_pickle_round_trip(self):
+        self.db.find_entry_by_private_address(False, SPEC_PRIVATE_ADDR)
+        state = self.db.__getstate__()
+        self.assertNotIn("_addr_index", state)
+        self.assertNotIn("_master_id_index", state)
+        self.assertNotIn("_resolved_addr_cache", state)
+        self._assert_lookups(pickle.loads(pickle.dumps(self.db)))
+
+    def test_load_old_format_pickle(self):
+        # Databases saved by previous versions have neither the indices nor the bonding data lookup keys
+        old_db = DefaultBondDatabase.__new__(DefaultBondDatabase)
+        old_db._records = self.db._records
+        old_db.current_id = self.db.current_id
+        for entry, bonding_keyset in zip(old_db._records, _keysets()):
+            entry.bonding_data = _old_format_bonding_data(bonding_keyset)
+
+        loaded = pickle.loads(pickle.dumps(old_db))
+        self._assert_lookups(loaded)
+        self.assertEqual(3, loaded.create().id)
+
+    def test_resolved_address_cache(self):
+        entry = self.db.find_entry_by_private_address(False, SPEC_PRIVATE_ADDR)
+        with mock.patch.object(BondDatabase, "find_entry_by_private_address") as scan:
+            self.assertIs(entry, self.db.find_entry_by_private_address(False, SPEC_PRIVATE_ADDR))
+        scan.assert_not_called()
+
+        # Changes to the database invalidate the cache
+        self.db.delete(entry)
+        self.assertEqual(0, len(self.db._resolved_addr_cache))
+        self.assertIsNone(self.db.find_entry_by_private_address(False, SPEC_PRIVATE_ADDR))
+
+    def test_resolved_address_cache_size_limited(self):
+        add_entry(self.db, peer_address(3), keyset(40, 41, irk=SPEC_IRK), peer_is_client=True)
+        self.db.RESOLVED_ADDRESS_CACHE_SIZE = 1
+        self.db.find_entry_by_private_address(False, SPEC_PRIVATE_ADDR)
+        self.db.find_entry_by_private_address(True, SPEC_PRIVATE_ADDR)
+        # Oldest resolved address is evicted
+        self.assertEqual([(True, bytes(SPEC_PRIVATE_ADDR.addr))], list(self.db._resolved_addr_cache.keys()))
+
+    def test_zero_irk_not_resolvable(self):
+        # Peers which don't distribute an IRK are reported by the driver with an all-zero key
+        entry = add_entry(self.db, peer_address(3), keyset(40, 41, irk=bytes(16)))
+        self.assertIsNone(entry.bonding_data.peer_irk_be)
+        self.assertEqual(SPEC_IRK[::-1], self.entries[2].bonding_data.peer_irk_be)
+        # Use an address which doesn't resolve so every entry is checked
+        unresolvable_addr = PeerAddress(BLEGapAddrTypes.random_private_resolvable, [0x70, 0x81, 0x94, 0, 0, 0])
+        with mock.patch.object(smp_crypto, "ble_ah", wraps=smp_crypto.ble_ah) as ble_ah:
+            self.assertIsNone(self.db.find_entry_by_private_address(False, unresolvable_addr))
+        self.assertEqual(3, ble_ah.call_count)
+        self.assertNotIn(bytes(16), [c.args[0] for c in ble_ah.call_args_list])
+
+    def test_delete_during_resolution_not_cached(self):
+        scan = BondDatabase.find_entry_by_private_address
+
+        def scan_then_delete(db, peer_is_client, peer_addr):
+            # Simulate the entry being deleted from another thread after the scan found it
+            entry = scan(db, peer_is_client, peer_addr)
+            db.delete(entry)
+            return entry
+
+        with mock.patch.object(BondDatabase, "find_entry_by_private_address", scan_then_delete):
+            self.assertIs(self.entries[2], self.db.find_entry_by_private_address(False, SPEC_PRIVATE_ADDR))
+        self.assertEqual(0, len(self.db._resolved_addr_cache))
+        self.assertIsNone(self.db.find_entry_by_private_address(False, SPEC_PRIVATE_ADDR))
+
+    def test_delete(self):
+        self.db.delete(self.entries[1])
+        self.assertIsNone(self.db.find_entry_by_peer_address(False, peer_address(1)))
+        self.assertIsNone(self.db.find_entry_by_master_id(False, master_id(20)))
+        self.assertIs(self.entries[2], self.db.find_entry_by_master_id(False, master_id(30)))
+
+    def test_delete_clears_key_cache(self):
+        # Deleted bonds' IRKs shouldn't be kept around in the cipher cache
+        for delete in [lambda: self.db.delete(self.entries[0]), self.db.delete_all]:
+            smp_crypto.ble_ah(self.entries[1].bonding_data.peer_id.irk, b"\x40\x00\x00")
+            delete()
+            self.assertEqual(0, smp_crypto._ecb_encryptor.cache_info().currsize)
+
+    def test_delete_all(self):
+        self.db.delete_all()
+        self.assertEqual([], list(self.db))
+        self.assertIsNone(self.db.find_entry_by_peer_address(False, peer_address(1)))
+        self.assertIsNone(self.db.find_entry_by_master_id(False, master_id(10)))
+        self.assertIsNone(self.db.find_entry_by_private_address(False, SPEC_PRIVATE_ADDR))
+
+        # Entries added after clearing are found again
+        entry = add_entry(self.db, peer_address(1), keyset(20, 21, irk=SPEC_IRK))
+        self.assertIs(entry, self.db.find_entry_by_peer_address(False, peer_address(1)))
+        self.assertIs(entry, self.db.find_entry_by_master_id(False, master_id(21)))
+        self.assertIs(entry, self.db.find_entry_by_private_address(False, SPEC_PRIVATE_ADDR))
+
+
+if __name__ == '__main__':
+    unittest.main()
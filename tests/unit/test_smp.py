@@ -0,0 +1,95 @@
+import types
+import unittest
+
+from blatann.gap.bond_db import BondDatabase
+from blatann.gap.default_bond_db import DefaultBondDatabase
+from blatann.gap.smp import SecurityManager
+from blatann.nrf.nrf_types import BLEGapAddrTypes
+
+from tests.unit.helpers import add_entry, keyset, master_id, peer_address
+
+
+class _ListBondDatabase(BondDatabase):
+    """
+    Bond database which uses the base class' linear searches for lookups
+    """
+    def __init__(self):
+        self._records = []
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def create(self):
+        return types.SimpleNamespace(id=len(self._records))
+
+    def add(self, db_entry):
+        self._records.append(db_entry)
+
+
+class TestFindDbEntry(unittest.TestCase):
+    DB_TYPE = DefaultBondDatabase
+
+    def setUp(self) -> None:
+        self.db = self.DB_TYPE()
+        self.lesc_entry = add_entry(self.db, peer_address(1), keyset(lesc=True))
+        self.legacy_entry = add_entry(self.db, peer_address(2), keyset(20, 21))
+        self.other_legacy_entry = add_entry(self.db, peer_address(3), keyset(30, 31))
+        self.client_entry = add_entry(self.db, peer_address(4), keyset(40, 41), peer_is_client=True)
+        self.security_manager = self._security_manager(peer_is_client=False)
+
+    def _security_manager(self, peer_is_client):
+        # Only the bond DB lookups are under test, skip the key generation and event registration in __init__
+        security_manager = SecurityManager.__new__(SecurityManager)
+        security_manager.ble_device = types.SimpleNamespace(bond_db=self.db)
+        security_manager.peer = types.SimpleNamespace(is_client=peer_is_client)
+        return security_manager
+
+    def _find(self, peer_addr, mid=None):
+        return self.security_manager._find_db_entry(peer_addr, mid)
+
+    def test_lesc_matched_by_address(self):
+        self.assertIs(self.lesc_entry, self._find(peer_address(1)))
+        # LESC bonds have no master ID, security info requests for them have an invalid (zeroed) master ID
+        self.assertIs(self.lesc_entry, self._find(peer_address(1), master_id()))
+
+    def test_lesc_ignores_unknown_master_id(self):
+        self.assertIs(self.lesc_entry, self._find(peer_address(1), master_id(99)))
+
+    def test_legacy_matched_by_address_without_master_id(self):
+        self.assertIs(self.legacy_entry, self._find(peer_address(2)))
+
+    def test_legacy_requires_master_id_match(self):
+        # Legacy LTKs are identified by master ID, an address match alone isn't enough when one is provided
+        self.assertIsNone(self._find(peer_address(2), master_id(99)))
+        self.assertIsNone(self._find(peer_address(2), master_id()))
+
+    def test_legacy_matched_by_master_id(self):
+        self.assertIs(self.legacy_entry, self._find(peer_address(2), master_id(20)))
+        self.assertIs(self.legacy_entry, self._find(peer_address(2), master_id(21)))
+        # Master ID match doesn't depend on the address, e.g. the peer is using a private address
+        self.assertIs(self.legacy_entry, self._find(peer_address(9), master_id(21)))
+
+    def test_master_id_takes_precedence_over_address(self):
+        self.assertIs(self.other_legacy_entry, self._find(peer_address(2), master_id(30)))
+        self.assertIs(self.other_legacy_entry, self._find(peer_address(1), master_id(31)))
+
+    def test_unknown_peer(self):
+        self.assertIsNone(self._find(peer_address(9)))
+        self.assertIsNone(self._find(peer_address(9), master_id(99)))
+        self.assertIsNone(self._find(peer_address(1, BLEGapAddrTypes.random_private_non_resolvable)))
+
+    def test_role_must_match(self):
+        self.assertIsNone(self._find(peer_address(4)))
+        self.assertIsNone(self._find(peer_address(9), master_id(40)))
+        self.security_manager = self._security_manager(peer_is_client=True)
+        self.assertIs(self.client_entry, self._find(peer_address(4)))
+        self.assertIs(self.client_entry, self._find(peer_address(9), master_id(40)))
+        self.assertIsNone(self._find(peer_address(2), master_id(20)))
+
+
+class TestFindDbEntryLinearSearch(TestFindDbEntry):
+    DB_TYPE = _ListBondDatabase
+
+
+if __name__ == '__main__':
+    unittest.main()
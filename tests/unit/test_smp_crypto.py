@@ -0,0 +1,57 @@
+import binascii
+import unittest
+
+from blatann.gap import smp_crypto
+
+
+class TestBleAh(unittest.TestCase):
+    # Sample data from the Bluetooth Core Specification v4.2 Vol.3, Part H, Appendix D.7
+    IRK = binascii.unhexlify("ec0234a357c8ad05341010a60a397d9b")
+    PRAND = binascii.unhexlify("708194")
+    HASH = binascii.unhexlify("0dfbaa")
+
+    def setUp(self) -> None:
+        smp_crypto.clear_key_cache()
+
+    def test_spec_vector(self):
+        self.assertEqual(self.HASH, smp_crypto.ble_ah(self.IRK, self.PRAND))
+        self.assertEqual(self.HASH, smp_crypto.ble_ah(bytearray(self.IRK), list(self.PRAND)))
+
+    def test_encryptor_cached_per_key(self):
+        smp_crypto.ble_ah(self.IRK, self.PRAND)
+        self.assertEqual(self.HASH, smp_crypto.ble_ah(bytearray(self.IRK), self.PRAND))
+        self.assertEqual(1, smp_crypto._ecb_encryptor.cache_info().hits)
+        smp_crypto.ble_ah(bytes(16), self.PRAND)
+        self.assertEqual(2, smp_crypto._ecb_encryptor.cache_info().currsize)
+
+    def test_clear_key_cache(self):
+        smp_crypto.ble_ah(self.IRK, self.PRAND)
+        smp_crypto.clear_key_cache()
+        self.assertEqual(0, smp_crypto._ecb_encryptor.cache_info().currsize)
+        self.assertEqual(self.HASH, smp_crypto.ble_ah(self.IRK, self.PRAND))
+
+    def test_invalid_prand_length(self):
+        with self.assertRaises(ValueError):
+            smp_crypto.ble_ah(self.IRK, self.PRAND[:2])
+
+
+class TestPrivateAddressResolves(unittest.TestCase):
+    IRK_BE = TestBleAh.IRK
+
+    class _Addr(object):
+        addr = [0x70, 0x81, 0x94, 0x0d, 0xfb, 0xaa]
+
+    def test_private_address_parts(self):
+        self.assertEqual((TestBleAh.PRAND, TestBleAh.HASH), smp_crypto.private_address_parts(self._Addr()))
+
+    def test_little_endian_irk(self):
+        self.assertTrue(smp_crypto.private_address_resolves(self._Addr(), bytearray(self.IRK_BE[::-1])))
+        self.assertFalse(smp_crypto.private_address_resolves(self._Addr(), self.IRK_BE))
+
+    def test_big_endian_irk(self):
+        self.assertTrue(smp_crypto.private_address_resolves(self._Addr(), self.IRK_BE, little_endian=False))
+        self.assertFalse(smp_crypto.private_address_resolves(self._Addr(), self.IRK_BE[::-1], little_endian=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import asyncio
+import threading
+import unittest
+
+from blatann.exceptions import TimeoutError
+from blatann.waitables.waitable import GenericWaitable, EmptyWaitable
+
+
+class TestWaitableAsync(unittest.TestCase):
+    def test_notify_before_as_future(self):
+        async def run():
+            waitable = GenericWaitable()
+            waitable.notify(1)
+            return await waitable.wait_async(1)
+
+        self.assertEqual(1, asyncio.run(run()))
+
+    def test_notify_after_as_future(self):
+        async def run():
+            waitable = GenericWaitable(n_args=2)
+            future = waitable.as_future()
+            self.assertIs(future, waitable.as_future())
+            waitable.notify(1, 2)
+            return await future
+
+        self.assertEqual((1, 2), asyncio.run(run()))
+
+    def test_notify_from_other_thread(self):
+        async def run():
+            waitable = GenericWaitable()
+            threading.Timer(0.05, waitable.notify, args=(3,)).start()
+            return await waitable.wait_async(2)
+
+        self.assertEqual(3, asyncio.run(run()))
+
+    def test_timeout_raises(self):
+        async def run():
+            await GenericWaitable().wait_async(0.01)
+
+        with self.assertRaises(TimeoutError):
+            asyncio.run(run())
+
+    def test_timeout_no_exception(self):
+        async def run():
+            waitable = GenericWaitable(n_args=2)
+            first = await waitable.wait_async(0.01, exception_on_timeout=False)
+            # A timeout must not cancel the future, waiting again times out the same way
+            second = await waitable.wait_async(0.01, exception_on_timeout=False)
+            return first, second
+
+        self.assertEqual(([None, None], [None, None]), asyncio.run(run()))
+
+    def test_wait_after_timeout(self):
+        async def run():
+            waitable = GenericWaitable()
+            future = waitable.as_future()
+            self.assertIsNone(await waitable.wait_async(0.01, exception_on_timeout=False))
+            # Futures handed out before the timeout are still usable
+            self.assertFalse(future.cancelled())
+            waitable.notify(4)
+            return await waitable.wait_async(1), await future
+
+        self.assertEqual((4, 4), asyncio.run(run()))
+
+    def test_cancelled_future_replaced(self):
+        async def run():
+            waitable = GenericWaitable()
+            waitable.as_future().cancel()
+            waitable.notify(5)
+            return await waitable.wait_async(1)
+
+        self.assertEqual(5, asyncio.run(run()))
+
+    def test_notify_after_loop_closed(self):
+        async def create_future():
+            waitable.as_future()
+
+        results = []
+        waitable = GenericWaitable().then(results.append)
+        asyncio.run(create_future())
+        waitable.notify(6)
+        self.assertEqual([6], results)
+        self.assertEqual(6, waitable.wait(0))
+
+    def test_empty_waitable(self):
+        async def run():
+            return await EmptyWaitable(1, 2).as_future()
+
+        self.assertEqual((1, 2), asyncio.run(run()))
+
+
+if __name__ == '__main__':
+    unittest.main()